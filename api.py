@@ -1,5 +1,13 @@
+# standard library helpers for startup timing and background loading
+import os
+import threading
+import time
+from contextlib import asynccontextmanager
+# process info for measuring time since process creation
+import psutil
 # FastAPI framework and Query helper
 from fastapi import FastAPI, Query
+from fastapi.responses import JSONResponse
 # Pydantic BaseModel for request validation
 from pydantic import BaseModel
 # custom recommender class
@@ -7,11 +15,38 @@ from recommender import SHLRecommender
 # utility functions for fetching and cleaning text
 from utils import fetch_text_from_url, clean_text
 
-# FastAPI application with a title
-app = FastAPI(title="SHL Assessment Recommender API")
+def _seconds_since_process_start() -> float:
+    """
+    Seconds elapsed since this process was created, so time-to-ready covers
+    interpreter start-up and framework imports, not only model loading.
+    """
+    return time.time() - psutil.Process().create_time()
+
+# recommender system, created lazily so importing this module stays fast
+reco = SHLRecommender(eager=False)
+
+# startup metrics reported by /ready
+startup = {"time_to_ready_s": None, "first_request_ms": None, "error": None}
 
-# recommender system
-reco = SHLRecommender()
+def _load_recommender():
+    """
+    Loading and warming up the recommender in the background.
+    """
+    try:
+        reco.load()
+        startup["time_to_ready_s"] = _seconds_since_process_start()
+    except Exception as e:
+        # Keeping the error so /ready can report why the worker is not ready
+        startup["error"] = repr(e)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Starting the load without blocking the server from accepting connections
+    threading.Thread(target=_load_recommender, daemon=True).start()
+    yield
+
+# FastAPI application with a title
+app = FastAPI(title="SHL Assessment Recommender API", lifespan=lifespan)
 
 # request body schema using Pydantic
 class RecommendationRequest(BaseModel):
@@ -24,9 +59,34 @@ class RecommendationRequest(BaseModel):
     # Whether to diversify recommendations (default True)
     diversify: bool = True
 
+# GET endpoint for liveness (process is up, may still be loading)
+@app.get("/health")
+def health():
+    return {"status": "ok"}
+
+# GET endpoint for readiness (503 until the recommender is loaded and warm)
+@app.get("/ready")
+def ready():
+    body = {
+        "status": "ready" if reco.ready else ("error" if startup["error"] else "loading"),
+        "pid": os.getpid(),  # identifies the worker when several are running
+        "load_s": reco.load_seconds,
+        "warmup_s": reco.warmup_seconds,
+        **startup,
+    }
+    return JSONResponse(body, status_code=200 if reco.ready else 503)
+
 # POST endpoint for recommendations
 @app.post("/recommend")
 def recommend(req: RecommendationRequest):
+    # Refusing requests until the recommender is loaded and warm (no inline loading)
+    if not reco.ready:
+        # Reporting a failed load as a server error so clients stop retrying
+        if startup["error"]:
+            return JSONResponse({"error": f"Model failed to load: {startup['error']}"}, status_code=500)
+        return JSONResponse({"error": "Model is still loading."}, status_code=503)
+
+    start = time.perf_counter()
     # Case 1: If text is provided, clean it
     if req.text:
         query = clean_text(req.text)
@@ -46,6 +106,10 @@ def recommend(req: RecommendationRequest):
     # Call the recommender system with the query
     df = reco.recommend(query, k=k, diversify=req.diversify)
 
+    # Recording latency of the first request served by this worker
+    if startup["first_request_ms"] is None:
+        startup["first_request_ms"] = (time.perf_counter() - start) * 1000.0
+
     # Format the response as JSON
     return {
         "count": len(df),  # number of recommendations
@@ -14,8 +14,12 @@ st.write(
     "Get 5–10 relevant individual assessments, balanced across technical and behavioral where applicable."
 )
 
-# recommender system
-reco = SHLRecommender()
+# recommender system, loaded and warmed up once per process instead of on every rerun
+@st.cache_resource(show_spinner="Loading recommender...")
+def get_recommender() -> SHLRecommender:
+    return SHLRecommender()
+
+reco = get_recommender()
 
 # Create two tabs: one for raw JD text, one for JD URL
 tab1, tab2 = st.tabs(["JD text", "JD URL"])
@@ -0,0 +1,374 @@
+# required libraries
+import argparse
+import os
+import random
+import socket
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import pandas as pd
+import psutil
+import requests
+
+def load_queries(paths=("test_queries.csv", "labeled_train.csv")) -> list[str]:
+    """
+    Loading the replay corpus from the query CSVs.
+    - paths: CSV files that contain a "Query" column
+
+    Returns:
+    - List of non-empty query strings
+    """
+    queries = []
+    for path in paths:
+        df = pd.read_csv(path)
+        queries.extend(str(q) for q in df["Query"].dropna() if str(q).strip())
+    return queries
+
+def free_port() -> int:
+    """
+    Asking the OS for an unused local TCP port.
+    """
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+def start_stub_server(queries: list[str]) -> tuple[ThreadingHTTPServer, str]:
+    """
+    Starting a local HTTP server that serves each query as a JD web page,
+    so URL traffic is exercised without depending on external sites.
+    - queries: replay corpus, served at /jd/<index>
+
+    Returns:
+    - (server, base_url) tuple; call server.shutdown() when done
+    """
+    class JDHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            # Resolving /jd/<index> to a query, 404 on anything else
+            try:
+                text = queries[int(self.path.rsplit("/", 1)[-1])]
+            except (ValueError, IndexError):
+                self.send_error(404)
+                return
+            body = f"<html><body><p>{escape(text)}</p></body></html>".encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            # Silencing per-request access logs
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", free_port()), JDHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+def start_api(workers: int, port: int, timeout: float = 600.0) -> tuple[subprocess.Popen, float]:
+    """
+    Launching api.py under uvicorn and waiting until every worker reports
+    ready on /ready (loaded and warmed up).
+    - workers: number of uvicorn worker processes
+    - port: local port to bind
+    - timeout: seconds to wait for the server to become ready
+
+    Returns:
+    - (process, time_to_ready_s) tuple, timed from launch
+    """
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "api:app",
+         "--host", "127.0.0.1", "--port", str(port),
+         "--workers", str(workers), "--log-level", "warning"],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+    )
+    ready_pids = set()  # workers seen reporting ready
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"api.py exited during startup (code {proc.returncode})")
+        try:
+            r = requests.get(f"http://127.0.0.1:{port}/ready", timeout=1)
+            body = r.json()
+            if r.ok:
+                ready_pids.add(body["pid"])
+                if len(ready_pids) >= workers:
+                    return proc, time.perf_counter() - start
+            elif body.get("error"):
+                stop_api(proc)
+                raise RuntimeError(f"api.py failed to load: {body['error']}")
+        except (requests.RequestException, ValueError):
+            pass
+        time.sleep(0.1)
+    stop_api(proc)
+    raise RuntimeError(f"api.py did not become ready within {timeout:.0f}s")
+
+def first_request_ms(api_url: str, payload: dict, timeout: float) -> float:
+    """
+    Timing the first /recommend request after readiness, in milliseconds.
+    """
+    start = time.perf_counter()
+    ok = send_request(api_url, payload, timeout)
+    return (time.perf_counter() - start) * 1000.0 if ok else float("nan")
+
+def stop_api(proc: subprocess.Popen):
+    """
+    Terminating the uvicorn process tree (supervisor and workers), killing
+    any worker left behind so it does not skew the next run.
+    """
+    # Collecting workers up front; they are reparented once the supervisor exits
+    try:
+        children = psutil.Process(proc.pid).children(recursive=True)
+    except psutil.Error:
+        children = []
+    proc.terminate()
+    try:
+        proc.wait(timeout=30)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+    _, alive = psutil.wait_procs(children, timeout=10)
+    for p in alive:
+        try:
+            p.kill()
+        except psutil.NoSuchProcess:
+            pass
+    psutil.wait_procs(alive, timeout=10)
+
+class ResourceSampler(threading.Thread):
+    """
+    Sampling CPU and RSS of the uvicorn process tree in the background.
+    """
+    def __init__(self, pid: int, interval: float = 0.5):
+        super().__init__(daemon=True)
+        self.root = psutil.Process(pid)
+        self._cache = {}  # pid -> psutil.Process, reused so cpu_percent has a baseline
+        self.interval = interval
+        self.cpu = []  # summed CPU percent per sample
+        self.rss = []  # summed RSS bytes per sample
+        self._halt = threading.Event()
+
+    def _procs(self) -> list[psutil.Process]:
+        """
+        Returning cached Process objects for the current tree. cpu_percent(None)
+        returns 0.0 on the first call per object, so new pids are primed here
+        and only contribute from the next sample on.
+        """
+        current = {p.pid: p for p in [self.root] + self.root.children(recursive=True)}
+        procs = []
+        for pid, p in current.items():
+            if pid not in self._cache:
+                try:
+                    p.cpu_percent(None)
+                except psutil.NoSuchProcess:
+                    continue
+                self._cache[pid] = p
+            procs.append(self._cache[pid])
+        # Dropping processes that have exited
+        for pid in set(self._cache) - set(current):
+            del self._cache[pid]
+        return procs
+
+    def run(self):
+        # Stopping cleanly if the uvicorn parent exits while sampling
+        try:
+            # Priming cpu_percent so the first real sample is meaningful
+            self._procs()
+        except psutil.Error:
+            return
+        while not self._halt.wait(self.interval):
+            try:
+                procs = self._procs()
+            except psutil.Error:
+                return
+            cpu, rss = 0.0, 0
+            for p in procs:
+                try:
+                    cpu += p.cpu_percent(None)
+                    rss += p.memory_info().rss
+                except psutil.NoSuchProcess:
+                    pass
+            self.cpu.append(cpu)
+            self.rss.append(rss)
+
+    def stop(self):
+        self._halt.set()
+        self.join()
+
+def send_request(api_url: str, payload: dict, timeout: float) -> bool:
+    """
+    Sending one /recommend request.
+
+    Returns:
+    - True on success; False on transport errors, non-200 status
+      or an application-level {"error": ...} response
+    """
+    try:
+        r = requests.post(f"{api_url}/recommend", json=payload, timeout=timeout)
+        return r.status_code == 200 and "error" not in r.json()
+    except (requests.RequestException, ValueError):
+        return False
+
+def run_open_loop(api_url: str, payloads: list[dict], rate: float, duration: float,
+                  concurrency: int, timeout: float, seed: int = 0) -> dict:
+    """
+    Replaying payloads with Poisson arrivals at a fixed rate (open loop).
+    Latency is measured from each request's scheduled send time, so queueing
+    delay caused by a saturated server is included rather than hidden.
+    - rate: target arrivals per second
+    - duration: length of the run in seconds
+    - concurrency: maximum requests in flight from the client side
+    """
+    rng = random.Random(seed)
+    latencies, errors = [], 0
+    lock = threading.Lock()
+
+    def fire(payload: dict, scheduled: float):
+        nonlocal errors
+        ok = send_request(api_url, payload, timeout)
+        elapsed = time.perf_counter() - scheduled
+        with lock:
+            if ok:
+                latencies.append(elapsed)
+            else:
+                errors += 1
+
+    sent, url_sent = 0, 0
+    start = time.perf_counter()
+    next_at = start
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        while True:
+            # Exponential inter-arrival gaps give a Poisson arrival process
+            next_at += rng.expovariate(rate)
+            if next_at - start > duration:
+                break
+            delay = next_at - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            payload = payloads[sent % len(payloads)]
+            pool.submit(fire, payload, next_at)
+            sent += 1
+            url_sent += "url" in payload
+    wall = time.perf_counter() - start
+
+    lat_ms = np.array(latencies) * 1000.0
+    pct = (lambda q: float(np.percentile(lat_ms, q))) if len(lat_ms) else (lambda q: float("nan"))
+    return {
+        "sent": sent,
+        "ok": len(latencies),
+        "errors": errors,
+        "error_rate": errors / sent if sent else 0.0,
+        "url_share": url_sent / sent if sent else 0.0,  # actual URL share of the traffic sent
+        "throughput_rps": len(latencies) / wall if wall else 0.0,
+        "p50_ms": pct(50),
+        "p90_ms": pct(90),
+        "p99_ms": pct(99),
+    }
+
+def build_payloads(queries: list[str], stub_url: str, url_fraction: float, seed: int = 0) -> list[dict]:
+    """
+    Building a shuffled mix of text and URL requests from the replay corpus.
+    - url_fraction: share of requests that go through the stub server as URLs
+
+    URL requests are drawn only from queries long enough to pass api.py's
+    200-character URL check (repeating them if needed), so short queries do
+    not show up as spurious errors while the mix still matches url_fraction.
+    """
+    rng = random.Random(seed)
+    eligible = [i for i, q in enumerate(queries) if len(q) >= 200]
+    n_url = round(url_fraction * len(queries)) if eligible else 0
+
+    # URL payloads cycle through a shuffled pool of long queries
+    url_ids = rng.sample(eligible, len(eligible)) if eligible else []
+    payloads = [{"url": f"{stub_url}/jd/{url_ids[j % len(url_ids)]}"} for j in range(n_url)]
+    # Text payloads fill the rest from the whole corpus
+    text_ids = rng.sample(range(len(queries)), len(queries))
+    payloads += [{"text": queries[text_ids[j % len(text_ids)]]} for j in range(len(queries) - n_url)]
+
+    rng.shuffle(payloads)
+    return payloads
+
+def main(workers=(1, 2, 4), rates=(1, 2, 5, 10, 20), duration: float = 30.0,
+         concurrency: int = 64, url_fraction: float = 0.2, timeout: float = 30.0,
+         out_path: str = "loadtest_results.csv"):
+    """
+    Sweeping worker counts and arrival rates against a local api.py.
+
+    Parameters:
+    - workers: uvicorn worker counts to test
+    - rates: open-loop arrival rates (requests/second), run in increasing order
+    - duration: seconds per rate step
+    - concurrency: client-side cap on in-flight requests
+    - url_fraction: share of URL requests in the traffic mix
+    - timeout: per-request timeout in seconds (timeouts count as errors)
+    - out_path: CSV with one row per (workers, rate) point
+    """
+    # Step 1: Loading queries and starting the JD stub server
+    queries = load_queries()
+    stub, stub_url = start_stub_server(queries)
+    payloads = build_payloads(queries, stub_url, url_fraction)
+
+    rows = []
+    try:
+        for w in workers:
+            # Step 2: Starting api.py with this worker count
+            port = free_port()
+            api_url = f"http://127.0.0.1:{port}"
+            proc, ready_s = start_api(w, port)
+            try:
+                first_ms = first_request_ms(api_url, {"text": queries[0]}, timeout)
+                print(f"workers={w} time_to_ready={ready_s:.1f}s first_request={first_ms:.1f}ms")
+
+                # Step 3: Spreading a short warm-up run over the workers before measuring
+                run_open_loop(api_url, payloads, rate=max(w, 1), duration=5.0,
+                              concurrency=concurrency, timeout=timeout)
+
+                # Step 4: Stepping through increasing arrival rates
+                for rate in sorted(rates):
+                    sampler = ResourceSampler(proc.pid)
+                    sampler.start()
+                    stats = run_open_loop(api_url, payloads, rate, duration, concurrency, timeout)
+                    sampler.stop()
+
+                    row = {"workers": w, "rate_rps": rate,
+                           "time_to_ready_s": ready_s, "first_request_ms": first_ms, **stats,
+                           "cpu_pct": float(np.mean(sampler.cpu)) if sampler.cpu else 0.0,
+                           "rss_mb": float(np.max(sampler.rss)) / 2**20 if sampler.rss else 0.0,
+                           "resource_samples": len(sampler.cpu)}  # low counts mean partial CPU/RSS data
+                    row["cpu_pct_per_worker"] = row["cpu_pct"] / w
+                    row["rss_mb_per_worker"] = row["rss_mb"] / w
+                    rows.append(row)
+                    # Saving after every point so an aborted sweep keeps what it measured
+                    pd.DataFrame(rows).to_csv(out_path, index=False)
+                    print(f"workers={w} rate={rate:>6.1f}/s  "
+                          f"tput={row['throughput_rps']:6.2f}/s  "
+                          f"p50={row['p50_ms']:8.1f}ms  p99={row['p99_ms']:8.1f}ms  "
+                          f"err={row['error_rate']:.1%}  cpu={row['cpu_pct']:.0f}%  "
+                          f"rss={row['rss_mb']:.0f}MB")
+            finally:
+                stop_api(proc)
+    finally:
+        stub.shutdown()
+        # Step 5: Reporting where the throughput/latency curves were saved
+        if rows:
+            print(f"Saved {len(rows)} load test results to {out_path}")
+
+# Entry point: parsing sweep settings when script is executed directly
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load test api.py with replayed queries.")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--rates", type=float, nargs="+", default=[1, 2, 5, 10, 20])
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--url-fraction", type=float, default=0.2)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--out", default="loadtest_results.csv")
+    args = parser.parse_args()
+    main(args.workers, args.rates, args.duration, args.concurrency,
+         args.url_fraction, args.timeout, args.out)
@@ -1,35 +1,126 @@
 # required libraries
-import faiss
-import numpy as np
-import pandas as pd
-from sentence_transformers import SentenceTransformer
+# faiss, pandas and sentence-transformers (which pulls in torch) are imported
+# lazily inside the methods that need them, so importing this module is cheap
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
 from utils import clean_text, categorize_query   # custom utility functions
 
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+# Representative queries used to warm up the encoder and the search path
+WARMUP_QUERIES = [
+    "Java developer who can collaborate with business stakeholders",
+    "Entry level sales role with strong English communication skills",
+    "Data analyst with SQL, Python and analytical reasoning",
+    "Customer support executive for a finance team",
+]
+
 class SHLRecommender:
     def __init__(self,
                  catalog_path="shl_assessments.csv",
                  index_path="assessments.index",
-                 model_name="all-MiniLM-L6-v2"):
+                 model_name="all-MiniLM-L6-v2",
+                 eager=True):
         """
         Initializing the recommender system.
         - catalog_path: path to the catalog CSV containing assessments
         - index_path: path to the FAISS index file
         - model_name: sentence transformer model for embeddings
+        - eager: load and warm up immediately; if False, call load() later
+          (the first recommend() call will also trigger it)
         """
+        self.catalog_path = catalog_path
+        self.index_path = index_path
+        self.model_name = model_name
+
+        self.df = None
+        self.index = None
+        self.model = None
+        self.categories = []
+
+        # Readiness state and startup timings (seconds)
+        self.ready = False
+        self.load_seconds = None
+        self.warmup_seconds = None
+        self._load_lock = threading.Lock()
+
+        if eager:
+            self.load()
+
+    def _load_catalog_and_index(self):
+        """
+        Loading the assessment catalog and the prebuilt FAISS index.
+        """
+        import faiss
+        import pandas as pd
+
         # Loading catalog of assessments
-        self.df = pd.read_csv(catalog_path)
+        self.df = pd.read_csv(self.catalog_path)
         # Loading prebuilt FAISS index
-        self.index = faiss.read_index(index_path)
-        # Loading sentence transformer model
-        self.model = SentenceTransformer(model_name)
-
+        self.index = faiss.read_index(self.index_path)
         # Precomputing category lookup for convenience
         self.categories = self.df["Category"].tolist()
 
+    def _load_model(self):
+        """
+        Loading the sentence transformer model.
+        """
+        from sentence_transformers import SentenceTransformer
+
+        self.model = SentenceTransformer(self.model_name)
+
+    def _warm_up(self):
+        """
+        Running a warm-up batch through the full recommend path so the first
+        real request does not pay for lazy graph and allocator initialization.
+        """
+        self.model.encode(WARMUP_QUERIES, convert_to_numpy=True)
+        for q in WARMUP_QUERIES:
+            self._recommend(q)
+
+    def load(self) -> "SHLRecommender":
+        """
+        Loading catalog, index and model, then warming up. The catalog/index
+        and the model are loaded in two threads so file and model-weight I/O
+        can overlap with the other side's imports; the imports themselves
+        are GIL-bound, so this is not a measured speed-up over a sequential
+        load. Safe to call from several threads; only the first call does
+        the work.
+        """
+        with self._load_lock:
+            if self.ready:
+                return self
+
+            # Loading catalog/index and model concurrently
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                futures = [pool.submit(self._load_catalog_and_index),
+                           pool.submit(self._load_model)]
+                for f in futures:
+                    f.result()  # re-raising any loading error
+            self.load_seconds = time.perf_counter() - start
+
+            # Warming up before reporting ready
+            start = time.perf_counter()
+            self._warm_up()
+            self.warmup_seconds = time.perf_counter() - start
+
+            self.ready = True
+        return self
+
     def _encode(self, text: str) -> np.ndarray:
         """
         Encoding a query string into a normalized embedding vector.
         """
+        import faiss
+
         emb = self.model.encode([text], convert_to_numpy=True)
         faiss.normalize_L2(emb)  # normalizing for cosine similarity
         return emb
@@ -41,6 +132,8 @@ class SHLRecommender:
         - desired_mix: dict specifying how many items per category (e.g. {"Coding": 4, "Behavior": 3})
         - k: total number of recommendations to return
         """
+        import pandas as pd
+
         picked = []  # list of selected rows
         counts = {cat: 0 for cat in desired_mix.keys()}  # track counts per category
 
@@ -72,6 +165,16 @@ class SHLRecommender:
         - k: number of recommendations to return
         - diversify: whether to balance recommendations across categories
         """
+        # Loading on first use if the recommender was created lazily
+        # (for library callers; api.py gates on readiness instead)
+        if not self.ready:
+            self.load()
+        return self._recommend(query, k=k, diversify=diversify)
+
+    def _recommend(self, query: str, k: int = 10, diversify: bool = True) -> pd.DataFrame:
+        """
+        Recommendation logic behind recommend(); assumes everything is loaded.
+        """
         # Cleaning query text
         query = clean_text(query)
         # Encoding query into embedding